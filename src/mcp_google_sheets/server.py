@@ -12,6 +12,9 @@ Configure via environment variables:
 - MCP_TRANSPORT: Transport protocol ('http', 'stdio', or 'sse', default: 'http')
 - MCP_HOST: Host to bind to for HTTP/SSE transport (default: '0.0.0.0')
 - MCP_PORT: Port to listen on for HTTP/SSE transport (default: 8000)
+- MCP_DRIVE_QPS: Client-side cap on each user's Drive API requests per second (default: 8, 0 disables)
+- MCP_LIST_TTL: Seconds to reuse list_spreadsheets results (default: 30, 0 disables)
+- MCP_READ_CACHE_TTL: Seconds to reuse results of read-only sheet tools (default: 0, disabled)
 - FASTMCP_SERVER_AUTH: Set to 'fastmcp.server.auth.providers.google.GoogleProvider' for Google OAuth
 - FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID: Your Google OAuth 2.0 Client ID
 - FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET: Your Google OAuth 2.0 Client Secret
@@ -19,9 +22,28 @@ Configure via environment variables:
 - FASTMCP_SERVER_AUTH_GOOGLE_REQUIRED_SCOPES: Required Google scopes (comma-separated)
 """
 
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
 import os
-from typing import List, Dict, Any, Optional, Union
+import random
+import re
+import threading
+import time
+import weakref
+from typing import List, Dict, Any, Optional, Tuple, Union
 import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+# orjson is an optional, faster drop-in for (de)serializing JSON payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # FastMCP2 imports
 from fastmcp import FastMCP
@@ -34,14 +56,23 @@ from starlette.responses import PlainTextResponse
 
 # Google API imports
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
 
 # Constants
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+SCOPES = ('https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive')
 DRIVE_FOLDER_ID = os.environ.get('DRIVE_FOLDER_ID', '')  # Working directory in Google Drive
 
 # Transport configuration
 TRANSPORT = os.environ.get('MCP_TRANSPORT', 'http')
+MCP_HOST = os.environ.get('MCP_HOST', '0.0.0.0')
+MCP_PORT = int(os.environ.get('MCP_PORT', '8000'))
+LOG_LEVEL = os.environ.get('FASTMCP_LOG_LEVEL', 'INFO')
+
+logger = logging.getLogger(__name__)
 
 # FastMCP Google OAuth configuration
 GOOGLE_CLIENT_ID = os.environ.get('FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID')
@@ -51,64 +82,566 @@ GOOGLE_SCOPES = os.environ.get('FASTMCP_SERVER_AUTH_GOOGLE_REQUIRED_SCOPES', 'op
 
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize obj to an indented JSON string, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# One keep-alive httplib2.Http per worker thread. httplib2 is not thread-safe,
+# so a single connection pool cannot be shared process-wide, but each thread
+# keeps its TLS connections to the Google APIs open across tool calls.
+_thread_local = threading.local()
+
+
+def _thread_http():
+    """Return the calling thread's pooled httplib2.Http, creating it on first use"""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = build_http()
+        _thread_local.http = http
+    return http
+
+
+# Transient failures worth retrying instead of failing the whole tool call
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+API_MAX_RETRIES = 5
+API_MAX_BACKOFF = 30  # seconds
+
+
+def _retry_delay(error: HttpError, attempt: int) -> float:
+    """Seconds to wait before retrying: the server's Retry-After if given, else jittered exponential backoff"""
+    retry_after = error.resp.get('retry-after')
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), API_MAX_BACKOFF)
+    return min(2 ** attempt, API_MAX_BACKOFF) + random.random()
+
+
+# Drive reports per-user throttling as 403 with one of these reasons rather than 429
+RATE_LIMIT_REASONS = frozenset({'rateLimitExceeded', 'userRateLimitExceeded', 'RATE_LIMIT_EXCEEDED'})
+
+
+def _api_error_reasons(error: HttpError) -> List[str]:
+    """
+    Reason codes in a Google API error body: those of the legacy 'errors' list
+    (e.g. 'userRateLimitExceeded') first, then those of any google.rpc.ErrorInfo
+    'details' (e.g. 'RATE_LIMIT_EXCEEDED').
+    
+    HttpError.error_details already holds one of the two lists, preferring
+    'details'; an untyped list there is therefore the whole 'errors' list and is
+    used as is. Only otherwise is the body parsed, once per error.
+    """
+    reasons = getattr(error, '_mcp_reasons', None)
+    if reasons is not None:
+        return reasons
+    details = error.error_details
+    if isinstance(details, list) and not any(isinstance(entry, dict) and '@type' in entry for entry in details):
+        lists = [details]
+    else:
+        try:
+            body = _json_loads(error.content)
+        except (ValueError, TypeError):
+            body = None
+        if isinstance(body, list) and body:
+            body = body[0]
+        error_body = body.get('error') if isinstance(body, dict) else None
+        lists = [error_body.get(key) for key in ('errors', 'details')] if isinstance(error_body, dict) else []
+    reasons = [entry['reason'] for entries in lists if isinstance(entries, list)
+               for entry in entries if isinstance(entry, dict) and isinstance(entry.get('reason'), str)]
+    error._mcp_reasons = reasons
+    return reasons
+
+
+def _is_retryable(error: Exception, idempotent: bool = True) -> bool:
+    """
+    Whether an API error is transient and the request should be sent again.
+    
+    Args:
+        error: The exception raised by the request
+        idempotent: Whether repeating the request is harmless; if not, 5xx errors aren't retried
+    """
+    if not isinstance(error, HttpError):
+        return False
+    if error.resp.status == 429 or (idempotent and error.resp.status in RETRYABLE_STATUSES):
+        return True
+    if error.resp.status == 403:
+        return any(reason in RATE_LIMIT_REASONS for reason in _api_error_reasons(error))
+    return False
+
+
+class _RetryingHttpRequest(HttpRequest):
+    """
+    HttpRequest whose execute() retries 429 and rate-limit 403 responses with
+    backoff, and 5xx responses too for requests that are safe to repeat
+    """
+    
+    def execute(self, http=None, num_retries=0):
+        idempotent = self.method in ('GET', 'PUT', 'DELETE') or self.methodId in IDEMPOTENT_METHOD_IDS
+        for attempt in range(API_MAX_RETRIES + 1):
+            try:
+                return super().execute(http=http, num_retries=num_retries)
+            except HttpError as e:
+                if not _is_retryable(e, idempotent) or attempt == API_MAX_RETRIES:
+                    raise
+                time.sleep(_retry_delay(e, attempt))
+
+
+def _build_request(http, *args, **kwargs):
+    """
+    HttpRequest factory that sends requests over the calling thread's pooled
+    connection, authorized with the credentials of the service that built it.
+    Requests must be executed on the thread that created them.
+    """
+    return _RetryingHttpRequest(AuthorizedHttp(http.credentials, http=_thread_http()), *args, **kwargs)
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+    
+    acquire(n) reserves n tokens and sleeps until they are available. Requests
+    larger than the burst are allowed and simply wait for the full deficit.
+    A rate of 0 or less disables limiting.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, n: int = 1) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+# Keep each user's Drive traffic under Drive's per-user quota (~10 QPS) rather than
+# relying on 429 backoff. Every Drive call site takes one token per HTTP request
+# it sends (a multipart batch counts once), from a bucket held per Drive client -
+# and so per user - so one user's bulk share can't stall everyone else's calls.
+DRIVE_QPS = float(os.environ.get('MCP_DRIVE_QPS', '8'))
+DRIVE_BURST = 10
+_drive_limiters: 'weakref.WeakKeyDictionary[Any, TokenBucket]' = weakref.WeakKeyDictionary()
+_drive_limiters_lock = threading.Lock()
+
+
+def _drive_limiter(drive_service) -> TokenBucket:
+    """Return the rate limiter for a user's Drive client, creating it on first use"""
+    with _drive_limiters_lock:
+        limiter = _drive_limiters.get(drive_service)
+        if limiter is None:
+            limiter = _drive_limiters[drive_service] = TokenBucket(rate=DRIVE_QPS, burst=DRIVE_BURST)
+        return limiter
+
+
+# Shared pool for fanning independent API requests out across threads. Being
+# long-lived, its threads keep their pooled connections between tool calls.
+MAX_API_WORKERS = 16
+_api_executor = ThreadPoolExecutor(max_workers=MAX_API_WORKERS, thread_name_prefix="google-api")
+
+
+@functools.lru_cache(maxsize=None)
+def _discovery_document(api: str, version: str) -> str:
+    """Read the discovery document bundled with google-api-python-client, once per process"""
+    document = get_static_doc(api, version)
+    if document is None:
+        raise Exception(f"No bundled discovery document for {api} {version}")
+    return document
+
+
+def _preload_discovery_documents():
+    """Load the Sheets and Drive discovery documents ahead of the first tool call"""
+    _discovery_document('sheets', 'v4')
+    _discovery_document('drive', 'v3')
+
+
+# Google API service objects, built once per OAuth access token and reused
+# across tool calls. Keyed by a digest of the token so that users never share
+# credentials and raw bearer tokens aren't kept around as dictionary keys.
+# Bounded so a long-running server with many users doesn't grow without limit;
+# the least recently used entry is dropped first.
+SERVICE_CACHE_MAXSIZE = 256
+_service_cache: 'OrderedDict[bytes, Tuple[Any, Any, Optional[str]]]' = OrderedDict()
+_service_cache_lock = threading.Lock()
+
+# Expiry (epoch seconds) of the access token behind each cached entry. The
+# credentials carry no refresh token - FastMCP's OAuth flow hands every request
+# a valid token - so expired entries are simply dropped by a background sweeper
+# instead of being checked or refreshed on the request path. Tokens that don't
+# report an expiry are kept for SERVICE_CACHE_TTL.
+_service_expiry: Dict[bytes, float] = {}
+_sweeper_started = False
+SERVICE_CACHE_SWEEP_INTERVAL = 60  # seconds
+SERVICE_CACHE_TTL = 1800  # seconds
+
+
+def _service_cache_key(access_token: str) -> bytes:
+    """Digest of an access token, used as its service cache key"""
+    return hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+
+
+def _sweep_service_cache():
+    """Periodically evict cached services whose access token has expired"""
+    while True:
+        time.sleep(SERVICE_CACHE_SWEEP_INTERVAL)
+        now = time.time()
+        with _service_cache_lock:
+            expired = [key for key, expires_at in _service_expiry.items() if expires_at <= now]
+            for key in expired:
+                _service_cache.pop(key, None)
+                del _service_expiry[key]
+
+
+def _start_sweeper():
+    """Start the cache sweeper thread once. Must be called with the cache lock held."""
+    global _sweeper_started
+    if not _sweeper_started:
+        threading.Thread(target=_sweep_service_cache, name="service-cache-sweeper", daemon=True).start()
+        _sweeper_started = True
+
+
+def _pin_resource(parent, name: str):
+    """Replace a collection accessor on a service Resource with one returning a single shared instance"""
+    resource = getattr(parent, name)()
+    setattr(parent, name, lambda: resource)
+    return resource
+
+
+def _build_google_services(token) -> Tuple[Any, Any, Optional[str]]:
+    """Build the Sheets and Drive services for a FastMCP access token"""
+    # Get scopes from the token claims instead of using hardcoded SCOPES
+    # This ensures we use the actual scopes granted during OAuth flow
+    token_scopes = token.claims.get('scope', '')
+    
+    # Handle different scope formats (space-separated or comma-separated)
+    if token_scopes:
+        if ' ' in token_scopes:
+            token_scopes = token_scopes.split()
+        elif ',' in token_scopes:
+            token_scopes = [s.strip() for s in token_scopes.split(',') if s.strip()]
+        else:
+            token_scopes = [token_scopes]
+    else:
+        # Fallback to default scopes if not available in token claims
+        token_scopes = SCOPES
+    
+    # Create Google credentials from the OAuth token with actual granted scopes
+    creds = Credentials(
+        token=token.token,
+        refresh_token=None,  # Not needed for OAuth flow
+        token_uri="https://oauth2.googleapis.com/token",
+        client_id=GOOGLE_CLIENT_ID,
+        client_secret=GOOGLE_CLIENT_SECRET,
+        scopes=token_scopes
+    )
+    
+    # Build the services for the current user. The discovery documents bundled
+    # with google-api-python-client are used instead of fetching them over the
+    # network, and are read from disk only once per process.
+    sheets_service = build_from_document(_discovery_document('sheets', 'v4'),
+                                         credentials=creds, requestBuilder=_build_request)
+    drive_service = build_from_document(_discovery_document('drive', 'v3'),
+                                        credentials=creds, requestBuilder=_build_request)
+    folder_id = DRIVE_FOLDER_ID if DRIVE_FOLDER_ID else None
+    
+    # Every call to a collection accessor such as spreadsheets() builds a fresh
+    # Resource from the discovery document, which costs tens of milliseconds.
+    # Resources hold no per-request state, so build the ones the tools use once.
+    spreadsheets = _pin_resource(sheets_service, 'spreadsheets')
+    _pin_resource(spreadsheets, 'values')
+    _pin_resource(spreadsheets, 'sheets')
+    _pin_resource(drive_service, 'files')
+    _pin_resource(drive_service, 'permissions')
+    
+    return sheets_service, drive_service, folder_id
+
+
 def get_google_services():
     """Get Google services using FastMCP Google OAuth for the current request"""
     # FastMCP Google OAuth is required
     if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
         raise Exception("Google OAuth credentials not configured. Please set FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID and FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET")
     
-    # Get credentials from FastMCP OAuth token for the current request
+    # Get the OAuth token from FastMCP for the current user
     try:
-        # Get the OAuth token from FastMCP for the current user
         token = get_access_token()
         
         # The AccessToken object has a 'token' attribute containing the access token
         access_token = token.token
-        
-        # Get scopes from the token claims instead of using hardcoded SCOPES
-        # This ensures we use the actual scopes granted during OAuth flow
-        token_scopes = token.claims.get('scope', '')
-        
-        # Handle different scope formats (space-separated or comma-separated)
-        if token_scopes:
-            if ' ' in token_scopes:
-                token_scopes = token_scopes.split()
-            elif ',' in token_scopes:
-                token_scopes = [s.strip() for s in token_scopes.split(',')]
-            else:
-                token_scopes = [token_scopes]
-        else:
-            # Fallback to default scopes if not available in token claims
-            token_scopes = SCOPES
-        
-        # Create Google credentials from the OAuth token with actual granted scopes
-        creds = Credentials(
-            token=access_token,
-            refresh_token=None,  # Not needed for OAuth flow
-            token_uri="https://oauth2.googleapis.com/token",
-            client_id=GOOGLE_CLIENT_ID,
-            client_secret=GOOGLE_CLIENT_SECRET,
-            scopes=token_scopes
-        )
-        
     except Exception as e:
         raise Exception(f"Failed to authenticate with Google APIs using OAuth token: {e}. Please ensure you are authenticated through the OAuth flow.")
     
-    # Build the services for the current user
-    sheets_service = build('sheets', 'v4', credentials=creds)
-    drive_service = build('drive', 'v3', credentials=creds)
-    folder_id = DRIVE_FOLDER_ID if DRIVE_FOLDER_ID else None
+    # Fast path: services for this token were already built
+    cache_key = _service_cache_key(access_token)
+    services = _service_cache.get(cache_key)
+    if services is not None:
+        try:
+            # A single C-level call, so safe without the lock; the entry may have just been evicted
+            _service_cache.move_to_end(cache_key)
+        except KeyError:
+            pass
+        return services
+    
+    with _service_cache_lock:
+        # Re-check under the lock in case another request built them meanwhile
+        services = _service_cache.get(cache_key)
+        if services is None:
+            try:
+                services = _build_google_services(token)
+            except Exception as e:
+                raise Exception(f"Failed to authenticate with Google APIs using OAuth token: {e}. Please ensure you are authenticated through the OAuth flow.")
+            if len(_service_cache) >= SERVICE_CACHE_MAXSIZE:
+                oldest, _ = _service_cache.popitem(last=False)
+                _service_expiry.pop(oldest, None)
+            _service_cache[cache_key] = services
+            _service_expiry[cache_key] = (token.expires_at if token.expires_at is not None
+                                          else time.time() + SERVICE_CACHE_TTL)
+            _start_sweeper()
+    
+    return services
+
+def _get_metadata(sheets_service, spreadsheet_id: str, fields: str) -> Dict[str, Any]:
+    """
+    Fetch spreadsheet metadata restricted to a fields mask. Without one the API
+    returns everything (protected ranges, conditional formats, charts, ...).
+    """
+    return sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id, fields=fields).execute()
+
+
+# A bounded A1 range without a sheet name, e.g. 'A1:C10'
+_A1_RANGE_RE = re.compile(r'^([A-Z]+)(\d+):([A-Z]+)(\d+)$')
+# A single cell or a bounded range without a sheet name, e.g. 'A1' or 'a1:C10'
+_A1_CELL_OR_RANGE_RE = re.compile(r'^([A-Za-z]+)(\d+)(?::([A-Za-z]+)(\d+))?$')
+# Sheet titles that can appear unquoted in A1 notation: plain words that don't
+# themselves look like a cell reference (A1 or R1C1 style)
+_PLAIN_SHEET_TITLE_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_CELL_REFERENCE_RE = re.compile(r'[A-Za-z]{1,3}\d+|[Rr]\d*[Cc]\d*')
+
+
+def _a1_sheet(sheet: str) -> str:
+    """
+    A sheet title as it must appear in A1 notation, quoted when it contains
+    spaces or punctuation or looks like a cell reference, so the API neither
+    rejects it nor reads it as a range. Titles the caller already quoted are
+    left alone.
+    """
+    if (sheet.startswith("'") and sheet.endswith("'") and len(sheet) > 1) or (
+            _PLAIN_SHEET_TITLE_RE.fullmatch(sheet) and not _CELL_REFERENCE_RE.fullmatch(sheet)):
+        return sheet
+    quoted = sheet.replace("'", "''")
+    return f"'{quoted}'"
+
+
+def _a1_range(sheet: str, range_str: str) -> str:
+    """Join a sheet title and a range into A1 notation, quoting the title as _a1_sheet does"""
+    return f"{_a1_sheet(sheet)}!{range_str}"
+
+
+def _resolve_sheet_id(sheets_service, spreadsheet_id: str, title: str) -> Optional[int]:
+    """
+    Translate a sheet title into its sheetId.
     
-    return sheets_service, drive_service, folder_id
+    Always read from the live sheet list: every caller goes on to modify the
+    sheet, and a title cached across calls could by then belong to a different
+    sheet (renamed or recreated outside this server), sending the write to the
+    wrong place without any error.
+    
+    Returns:
+        The sheetId, or None if the spreadsheet has no sheet with that title
+    """
+    spreadsheet = _get_metadata(sheets_service, spreadsheet_id, 'sheets.properties(title,sheetId)')
+    for sheet in spreadsheet.get('sheets', []):
+        if sheet['properties']['title'] == title:
+            return sheet['properties']['sheetId']
+    return None
+
+
+def _replace_sheet_id(obj: Any, old_id: int, new_id: int) -> Any:
+    """Copy of a batchUpdate request body with every reference to old_id pointing at new_id"""
+    if isinstance(obj, dict):
+        return {key: new_id if key in ('sheetId', 'sourceSheetId') and value == old_id
+                else _replace_sheet_id(value, old_id, new_id)
+                for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_replace_sheet_id(value, old_id, new_id) for value in obj]
+    return obj
+
+
+def _execute_sheet_update(sheets_service, spreadsheet_id: str, sheet: str, sheet_id: int,
+                          request_body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute a spreadsheets().batchUpdate that references the sheetId resolved for sheet.
+    
+    If the API rejects it with a 400, the sheet may have been deleted and recreated
+    since it was resolved, so its id is looked up again and the request is sent once
+    more against the new id. A 400 means nothing was applied, so this is safe.
+    """
+    try:
+        return sheets_service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=request_body
+        ).execute()
+    except HttpError as e:
+        if e.resp.status != 400:
+            raise
+        current_id = _resolve_sheet_id(sheets_service, spreadsheet_id, sheet)
+        if current_id is None or current_id == sheet_id:
+            raise
+        return sheets_service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body=_replace_sheet_id(request_body, sheet_id, current_id)
+        ).execute()
+
+
+def _run_in_thread(fn):
+    """
+    Expose a blocking tool function as a coroutine that runs it in a worker thread.
+    
+    FastMCP calls synchronous tools directly on the event loop, so one slow
+    Google API call would stall every other request. asyncio.to_thread copies
+    the context, so get_access_token() still sees the caller's token.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+
+# Short-lived results of read-only sheet tools, so agents re-reading the same range
+# across reasoning steps don't pay a round-trip each time. Held per Sheets client (and
+# so per user) and dropped whenever a tool of this server modifies the spreadsheet.
+# Edits made elsewhere go unnoticed for up to READ_CACHE_TTL seconds, so the cache is
+# off unless MCP_READ_CACHE_TTL is set.
+READ_CACHE_TTL = float(os.environ.get('MCP_READ_CACHE_TTL', '0'))  # seconds
+READ_CACHE_MAXSIZE = 256  # entries per user
+_read_cache: 'weakref.WeakKeyDictionary[Any, Dict[Tuple, Tuple[float, Any]]]' = weakref.WeakKeyDictionary()
+# Bumped on every modification, so a read that raced with a write isn't cached. A
+# single counter rather than one per spreadsheet, which would grow without bound;
+# the cost is that a write anywhere also skips caching reads in flight elsewhere.
+_read_generation = 0
+_read_cache_lock = threading.Lock()
+
+
+def _cached_read(fn):
+    """Serve repeat calls of a read-only tool taking a spreadsheet_id from the read cache"""
+    signature = inspect.signature(fn)
+    
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if READ_CACHE_TTL <= 0:
+            return fn(*args, **kwargs)
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        spreadsheet_id = bound.arguments['spreadsheet_id']
+        key = (spreadsheet_id, fn.__name__, tuple(bound.arguments.items()))
+        sheets_service, _, _ = get_google_services()
+        
+        with _read_cache_lock:
+            entries = _read_cache.setdefault(sheets_service, {})
+            cached = entries.get(key)
+            generation = _read_generation
+        if cached is not None and time.monotonic() - cached[0] < READ_CACHE_TTL:
+            return cached[1]
+        
+        result = fn(*args, **kwargs)
+        with _read_cache_lock:
+            if _read_generation == generation:
+                if len(entries) >= READ_CACHE_MAXSIZE:
+                    del entries[next(iter(entries))]
+                entries[key] = (time.monotonic(), result)
+        return result
+    return wrapper
+
+
+def _invalidate_reads(*spreadsheet_ids: Optional[str]):
+    """Forget every user's cached reads of the given spreadsheets"""
+    global _read_generation
+    with _read_cache_lock:
+        _read_generation += 1
+        for entries in _read_cache.values():
+            for key in [key for key in entries if key[0] in spreadsheet_ids]:
+                del entries[key]
+
+
+def _invalidates_reads(*params: str):
+    """Drop cached reads of the spreadsheets named by these parameters once the decorated tool has run"""
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                # Also after failures, which may have partially applied
+                _invalidate_reads(*(bound.arguments.get(param) for param in params))
+        return wrapper
+    return decorator
+
 
 # Initialize the FastMCP2 server with Google OAuth (required)
 if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
     raise Exception("Google OAuth credentials are required. Please set FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_ID and FASTMCP_SERVER_AUTH_GOOGLE_CLIENT_SECRET")
 
-# Parse scopes from environment variable
-required_scopes = [scope.strip() for scope in GOOGLE_SCOPES.split(',')]
-
-auth_provider = GoogleProvider(
+# Parse scopes from environment variable, ignoring empty entries from stray or trailing commas
+required_scopes = [scope.strip() for scope in GOOGLE_SCOPES.split(',') if scope.strip()]
+
+# Successful token validations, keyed like the service cache. GoogleProvider
+# otherwise calls Google's tokeninfo and userinfo endpoints on every request;
+# entries live for TOKEN_CACHE_TTL or until the token expires, whichever is
+# sooner. Failures are never cached.
+TOKEN_CACHE_TTL = 300  # seconds
+TOKEN_CACHE_MAXSIZE = 1024
+_token_cache: Dict[bytes, Tuple[Any, float]] = {}
+
+
+class _CachingGoogleProvider(GoogleProvider):
+    """GoogleProvider that remembers validated access tokens for a short while"""
+    
+    async def load_access_token(self, token: str):
+        key = _service_cache_key(token)
+        now = time.time()
+        cached = _token_cache.get(key)
+        if cached is not None:
+            access_token, deadline = cached
+            if now < deadline:
+                return access_token
+            del _token_cache[key]
+        
+        access_token = await super().load_access_token(token)
+        if access_token is not None:
+            deadline = now + TOKEN_CACHE_TTL
+            if access_token.expires_at:
+                deadline = min(deadline, access_token.expires_at)
+            if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+                del _token_cache[next(iter(_token_cache))]
+            _token_cache[key] = (access_token, deadline)
+        return access_token
+    
+    async def revoke_token(self, token):
+        _token_cache.pop(_service_cache_key(token.token), None)
+        await super().revoke_token(token)
+
+
+auth_provider = _CachingGoogleProvider(
     client_id=GOOGLE_CLIENT_ID,
     client_secret=GOOGLE_CLIENT_SECRET,
     base_url=GOOGLE_BASE_URL,
@@ -118,7 +651,22 @@ auth_provider = GoogleProvider(
 print(f"FastMCP Google OAuth configured with base URL: {GOOGLE_BASE_URL}")
 print(f"Required scopes: {required_scopes}")
 
-mcp = FastMCP("Google Spreadsheet", auth=auth_provider)
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """
+    Do the process-wide part of the Google API bootstrap before tools run.
+    
+    FastMCP enters this as each MCP session starts, so the discovery documents
+    are loaded before the first tool call rather than during it; later sessions
+    hit the cache. Per-user services still need the request's OAuth token and
+    are built on that user's first call.
+    """
+    await asyncio.to_thread(_preload_discovery_documents)
+    yield
+
+
+mcp = FastMCP("Google Spreadsheet", auth=auth_provider, lifespan=lifespan)
 
 
 @mcp.custom_route("/clear_oauth_cache", methods=["GET"])
@@ -167,11 +715,18 @@ def get_user_info() -> Dict[str, Any]:
         return {"error": f"Failed to get user info: {str(e)}"}
 
 
-@mcp.tool(annotations={"readOnlyHint": True})
+# No output schema: the return type is a union, which FastMCP would otherwise
+# wrap under a "result" key and change the structured shape of the default reply
+@mcp.tool(annotations={"readOnlyHint": True}, output_schema=None)
+@_run_in_thread
+@_cached_read
 def get_sheet_data(spreadsheet_id: str, 
                    sheet: str,
                    range: Optional[str] = None,
-                   include_grid_data: bool = False) -> Dict[str, Any]:
+                   include_grid_data: bool = False,
+                   raw_values: bool = False,
+                   value_render_option: str = 'FORMATTED_VALUE',
+                   date_time_render_option: str = 'SERIAL_NUMBER') -> Union[Dict[str, Any], List[List[Any]]]:
     """
     Get data from a specific sheet in a Google Spreadsheet.
     
@@ -183,17 +738,25 @@ def get_sheet_data(spreadsheet_id: str,
             Note: Setting this to True will significantly increase the response size and token usage
             when parsing the response, as it includes detailed cell formatting information.
             Default is False (returns values only, more efficient).
+        raw_values: If True (and include_grid_data is False), return just the 2D array of cell
+            values, like get_sheet_formulas, instead of wrapping it in a valueRanges structure.
+        value_render_option: How values are rendered when include_grid_data is False:
+            'FORMATTED_VALUE' (default, as displayed in the UI), 'UNFORMATTED_VALUE' (raw numbers
+            and booleans; smaller and faster for numeric sheets) or 'FORMULA'.
+        date_time_render_option: How dates and times are rendered when value_render_option is not
+            'FORMATTED_VALUE': 'SERIAL_NUMBER' (default) or 'FORMATTED_STRING'.
     
     Returns:
-        Grid data structure with either full metadata or just values from Google Sheets API, depending on include_grid_data parameter
+        Grid data structure with either full metadata or just values from Google Sheets API, depending on include_grid_data parameter,
+        or the bare 2D array of values when raw_values is True
     """
     sheets_service, _, _ = get_google_services()
 
     # Construct the range - keep original API behavior
     if range:
-        full_range = f"{sheet}!{range}"
+        full_range = _a1_range(sheet, range)
     else:
-        full_range = sheet
+        full_range = _a1_sheet(sheet)
     
     if include_grid_data:
         # Use full API to get all grid data including formatting
@@ -206,21 +769,29 @@ def get_sheet_data(spreadsheet_id: str,
         # Use values API to get cell values only (more efficient)
         values_result = sheets_service.spreadsheets().values().get(
             spreadsheetId=spreadsheet_id,
-            range=full_range
+            range=full_range,
+            valueRenderOption=value_render_option,
+            dateTimeRenderOption=date_time_render_option
         ).execute()
+        values = values_result.get('values', [])
+        
+        if raw_values:
+            return values
         
         # Format the response to match expected structure
         result = {
             'spreadsheetId': spreadsheet_id,
             'valueRanges': [{
                 'range': full_range,
-                'values': values_result.get('values', [])
+                'values': values
             }]
         }
 
     return result
 
 @mcp.tool(annotations={"readOnlyHint": True})
+@_run_in_thread
+@_cached_read
 def get_sheet_formulas(spreadsheet_id: str,
                        sheet: str,
                        range: Optional[str] = None) -> List[List[Any]]:
@@ -239,9 +810,9 @@ def get_sheet_formulas(spreadsheet_id: str,
     
     # Construct the range
     if range:
-        full_range = f"{sheet}!{range}"
+        full_range = _a1_range(sheet, range)
     else:
-        full_range = sheet  # Get all formulas in the specified sheet
+        full_range = _a1_sheet(sheet)  # Get all formulas in the specified sheet
     
     # Call the Sheets API
     result = sheets_service.spreadsheets().values().get(
@@ -255,6 +826,8 @@ def get_sheet_formulas(spreadsheet_id: str,
     return formulas
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet_id')
 def update_cells(spreadsheet_id: str,
                 sheet: str,
                 range: str,
@@ -274,7 +847,7 @@ def update_cells(spreadsheet_id: str,
     sheets_service, _, _ = get_google_services()
     
     # Construct the range
-    full_range = f"{sheet}!{range}"
+    full_range = _a1_range(sheet, range)
     
     # Prepare the value range object
     value_range_body = {
@@ -292,10 +865,96 @@ def update_cells(spreadsheet_id: str,
     return result
 
 
+def _coalesce_ranges(ranges: Dict[str, List[List[Any]]]) -> List[Tuple[str, List[List[Any]], List[str]]]:
+    """
+    Merge consecutive ranges that continue each other down the same columns,
+    e.g. 'A1:B2' followed by 'A3:B4' becomes 'A1:B4', so row-by-row updates
+    are sent as one range.
+    
+    Only neighbours in the caller's order are merged, so the order of
+    overlapping writes is preserved, and only when the earlier values fill
+    every row of their range, so no rows shift.
+    
+    Returns:
+        (range, values, caller's ranges merged into it) for each range to send
+    """
+    merged: List[Tuple[str, List[List[Any]], List[str]]] = []
+    last = None  # (col_start, row_start, col_end, row_end) of merged[-1], if it parsed
+    for range_str, values in ranges.items():
+        match = _A1_RANGE_RE.match(range_str)
+        if not match:
+            merged.append((range_str, values, [range_str]))
+            last = None
+            continue
+        col_start, row_start, col_end, row_end = match.group(1), int(match.group(2)), match.group(3), int(match.group(4))
+        if (last is not None and (col_start, col_end) == (last[0], last[2]) and row_start == last[3] + 1
+                and len(merged[-1][1]) == last[3] - last[1] + 1):
+            _, merged_values, members = merged[-1]
+            merged_values.extend(values)
+            members.append(range_str)
+            merged[-1] = (f"{col_start}{last[1]}:{col_end}{row_end}", merged_values, members)
+            last = (col_start, last[1], col_end, row_end)
+        else:
+            # Copied so that merging never extends the caller's list
+            merged.append((range_str, list(values), [range_str]))
+            last = (col_start, row_start, col_end, row_end)
+    return merged
+
+
+def _column_index(letters: str) -> int:
+    """A1 column letters to their 0-based index, e.g. 'A' -> 0, 'AB' -> 27"""
+    return sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(letters.upper()))) - 1
+
+
+def _column_letters(index: int) -> str:
+    """0-based column index to its A1 letters, e.g. 0 -> 'A', 27 -> 'AB'"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def _split_update_response(response: Dict[str, Any], members: List[str],
+                           ranges: Dict[str, List[List[Any]]]) -> List[Dict[str, Any]]:
+    """
+    Turn the UpdateValuesResponse of a merged range back into one response per
+    range the caller sent, as if each had been written on its own.
+    """
+    if len(members) == 1:
+        return [response]
+    sheet_prefix = response.get('updatedRange', '').rpartition('!')[0]
+    split = []
+    for range_str in members:
+        values = ranges[range_str]
+        entry = {'spreadsheetId': response.get('spreadsheetId')}
+        cells = sum(len(row) for row in values)
+        if not cells:
+            entry['updatedRange'] = f"{sheet_prefix}!{range_str}" if sheet_prefix else range_str
+        else:
+            col_start, row_start = _A1_RANGE_RE.match(range_str).group(1, 2)
+            rows = len(values)
+            columns = max(len(row) for row in values)
+            last_column = _column_letters(_column_index(col_start) + columns - 1)
+            written = f"{col_start}{row_start}:{last_column}{int(row_start) + rows - 1}"
+            entry.update({
+                'updatedRange': f"{sheet_prefix}!{written}" if sheet_prefix else written,
+                'updatedRows': rows,
+                'updatedColumns': columns,
+                'updatedCells': cells,
+            })
+        split.append(entry)
+    return split
+
+
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet_id')
 def batch_update_cells(spreadsheet_id: str,
                        sheet: str,
-                       ranges: Dict[str, List[List[Any]]]) -> Dict[str, Any]:
+                       ranges: Dict[str, List[List[Any]]],
+                       value_input_option: str = 'USER_ENTERED') -> Dict[str, Any]:
     """
     Batch update multiple ranges in a Google Spreadsheet.
     
@@ -304,23 +963,23 @@ def batch_update_cells(spreadsheet_id: str,
         sheet: The name of the sheet
         ranges: Dictionary mapping range strings to 2D arrays of values
                e.g., {'A1:B2': [[1, 2], [3, 4]], 'D1:E2': [['a', 'b'], ['c', 'd']]}
+               Consecutive ranges stacking down the same columns are sent as one range.
+        value_input_option: How input data is interpreted. 'USER_ENTERED' (default) parses
+            values as if typed into the UI (formulas, dates, numbers); 'RAW' stores them as-is,
+            which skips parsing when writing plain numbers or strings.
     
     Returns:
-        Result of the batch update operation
+        Result of the batch update operation, with one entry in 'responses' per range
+        in ranges, in the same order, even where ranges were merged for sending
     """
     sheets_service, _, _ = get_google_services()
     
     # Prepare the batch update request
-    data = []
-    for range_str, values in ranges.items():
-        full_range = f"{sheet}!{range_str}"
-        data.append({
-            'range': full_range,
-            'values': values
-        })
+    coalesced = _coalesce_ranges(ranges)
+    data = [{'range': _a1_range(sheet, range_str), 'values': values} for range_str, values, _ in coalesced]
     
     batch_body = {
-        'valueInputOption': 'USER_ENTERED',
+        'valueInputOption': value_input_option,
         'data': data
     }
     
@@ -330,10 +989,17 @@ def batch_update_cells(spreadsheet_id: str,
         body=batch_body
     ).execute()
     
+    if 'responses' in result and len(result['responses']) == len(coalesced) != len(ranges):
+        # Report merged ranges under the caller's own ranges again
+        result['responses'] = [entry for response, (_, _, members) in zip(result['responses'], coalesced)
+                               for entry in _split_update_response(response, members, ranges)]
+    
     return result
 
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet_id')
 def add_rows(spreadsheet_id: str,
              sheet: str,
              count: int,
@@ -353,18 +1019,13 @@ def add_rows(spreadsheet_id: str,
     sheets_service, _, _ = get_google_services()
     
     # Get sheet ID
-    spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    sheet_id = None
+    sheet_id = _resolve_sheet_id(sheets_service, spreadsheet_id, sheet)
     
-    for s in spreadsheet['sheets']:
-        if s['properties']['title'] == sheet:
-            sheet_id = s['properties']['sheetId']
-            break
-            
     if sheet_id is None:
         return {"error": f"Sheet '{sheet}' not found"}
     
     # Prepare the insert rows request
+    start_index = start_row if start_row is not None else 0
     request_body = {
         "requests": [
             {
@@ -372,25 +1033,24 @@ def add_rows(spreadsheet_id: str,
                     "range": {
                         "sheetId": sheet_id,
                         "dimension": "ROWS",
-                        "startIndex": start_row if start_row is not None else 0,
-                        "endIndex": (start_row if start_row is not None else 0) + count
+                        "startIndex": start_index,
+                        "endIndex": start_index + count
                     },
-                    "inheritFromBefore": start_row is not None and start_row > 0
+                    "inheritFromBefore": start_index > 0
                 }
             }
         ]
     }
     
     # Execute the request
-    result = sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=request_body
-    ).execute()
+    result = _execute_sheet_update(sheets_service, spreadsheet_id, sheet, sheet_id, request_body)
     
     return result
 
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet_id')
 def add_columns(spreadsheet_id: str,
                 sheet: str,
                 count: int,
@@ -410,18 +1070,13 @@ def add_columns(spreadsheet_id: str,
     sheets_service, _, _ = get_google_services()
     
     # Get sheet ID
-    spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    sheet_id = None
+    sheet_id = _resolve_sheet_id(sheets_service, spreadsheet_id, sheet)
     
-    for s in spreadsheet['sheets']:
-        if s['properties']['title'] == sheet:
-            sheet_id = s['properties']['sheetId']
-            break
-            
     if sheet_id is None:
         return {"error": f"Sheet '{sheet}' not found"}
     
     # Prepare the insert columns request
+    start_index = start_column if start_column is not None else 0
     request_body = {
         "requests": [
             {
@@ -429,25 +1084,24 @@ def add_columns(spreadsheet_id: str,
                     "range": {
                         "sheetId": sheet_id,
                         "dimension": "COLUMNS",
-                        "startIndex": start_column if start_column is not None else 0,
-                        "endIndex": (start_column if start_column is not None else 0) + count
+                        "startIndex": start_index,
+                        "endIndex": start_index + count
                     },
-                    "inheritFromBefore": start_column is not None and start_column > 0
+                    "inheritFromBefore": start_index > 0
                 }
             }
         ]
     }
     
     # Execute the request
-    result = sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=request_body
-    ).execute()
+    result = _execute_sheet_update(sheets_service, spreadsheet_id, sheet, sheet_id, request_body)
     
     return result
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
+@_run_in_thread
+@_cached_read
 def list_sheets(spreadsheet_id: str) -> List[str]:
     """
     List all sheets in a Google Spreadsheet.
@@ -461,7 +1115,7 @@ def list_sheets(spreadsheet_id: str) -> List[str]:
     sheets_service, _, _ = get_google_services()
     
     # Get spreadsheet metadata
-    spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    spreadsheet = _get_metadata(sheets_service, spreadsheet_id, 'sheets.properties.title')
     
     # Extract sheet names
     sheet_names = [sheet['properties']['title'] for sheet in spreadsheet['sheets']]
@@ -470,6 +1124,8 @@ def list_sheets(spreadsheet_id: str) -> List[str]:
 
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('dst_spreadsheet')
 def copy_sheet(src_spreadsheet: str,
                src_sheet: str,
                dst_spreadsheet: str,
@@ -489,17 +1145,27 @@ def copy_sheet(src_spreadsheet: str,
     sheets_service, _, _ = get_google_services()
     
     # Get source sheet ID
-    src = sheets_service.spreadsheets().get(spreadsheetId=src_spreadsheet).execute()
-    src_sheet_id = None
+    src_sheet_id = _resolve_sheet_id(sheets_service, src_spreadsheet, src_sheet)
     
-    for s in src['sheets']:
-        if s['properties']['title'] == src_sheet:
-            src_sheet_id = s['properties']['sheetId']
-            break
-            
     if src_sheet_id is None:
         return {"error": f"Source sheet '{src_sheet}' not found"}
     
+    if src_spreadsheet == dst_spreadsheet:
+        # Within one spreadsheet duplicateSheet copies and names the sheet in a single round-trip
+        request_body = {
+            "requests": [
+                {
+                    "duplicateSheet": {
+                        "sourceSheetId": src_sheet_id,
+                        "newSheetName": dst_sheet
+                    }
+                }
+            ]
+        }
+        result = _execute_sheet_update(sheets_service, src_spreadsheet, src_sheet, src_sheet_id, request_body)
+        copy_result = result['replies'][0]['duplicateSheet']['properties']
+        return {"copy": copy_result}
+    
     # Copy the sheet to destination spreadsheet
     copy_result = sheets_service.spreadsheets().sheets().copyTo(
         spreadsheetId=src_spreadsheet,
@@ -543,6 +1209,8 @@ def copy_sheet(src_spreadsheet: str,
 
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet')
 def rename_sheet(spreadsheet: str,
                  sheet: str,
                  new_name: str) -> Dict[str, Any]:
@@ -560,14 +1228,8 @@ def rename_sheet(spreadsheet: str,
     sheets_service, _, _ = get_google_services()
     
     # Get sheet ID
-    spreadsheet_data = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet).execute()
-    sheet_id = None
+    sheet_id = _resolve_sheet_id(sheets_service, spreadsheet, sheet)
     
-    for s in spreadsheet_data['sheets']:
-        if s['properties']['title'] == sheet:
-            sheet_id = s['properties']['sheetId']
-            break
-            
     if sheet_id is None:
         return {"error": f"Sheet '{sheet}' not found"}
     
@@ -587,16 +1249,16 @@ def rename_sheet(spreadsheet: str,
     }
     
     # Execute the request
-    result = sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet,
-        body=request_body
-    ).execute()
+    result = _execute_sheet_update(sheets_service, spreadsheet, sheet, sheet_id, request_body)
     
     return result
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
-def get_multiple_sheet_data(queries: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+@_run_in_thread
+def get_multiple_sheet_data(queries: List[Dict[str, str]],
+                            value_render_option: str = 'FORMATTED_VALUE',
+                            date_time_render_option: str = 'SERIAL_NUMBER') -> List[Dict[str, Any]]:
     """
     Get data from multiple specific ranges in Google Spreadsheets.
     
@@ -605,46 +1267,157 @@ def get_multiple_sheet_data(queries: List[Dict[str, str]]) -> List[Dict[str, Any
                  Each dictionary should have 'spreadsheet_id', 'sheet', and 'range' keys.
                  Example: [{'spreadsheet_id': 'abc', 'sheet': 'Sheet1', 'range': 'A1:B5'}, 
                            {'spreadsheet_id': 'xyz', 'sheet': 'Data', 'range': 'C1:C10'}]
+        value_render_option: 'FORMATTED_VALUE' (default), 'UNFORMATTED_VALUE' or 'FORMULA',
+            as in get_sheet_data.
+        date_time_render_option: 'SERIAL_NUMBER' (default) or 'FORMATTED_STRING', as in get_sheet_data.
     
     Returns:
         A list of dictionaries, each containing the original query parameters 
         and the fetched 'data' or an 'error'.
     """
     sheets_service, _, _ = get_google_services()
-    results = []
+    results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
     
-    for query in queries:
+    # Group the ranges by spreadsheet so each spreadsheet costs one batchGet.
+    # Identical ranges are requested once and shared by every query asking for them.
+    groups: Dict[str, Dict[str, List[int]]] = {}
+    for i, query in enumerate(queries):
         spreadsheet_id = query.get('spreadsheet_id')
         sheet = query.get('sheet')
         range_str = query.get('range')
         
         if not all([spreadsheet_id, sheet, range_str]):
-            results.append({**query, 'error': 'Missing required keys (spreadsheet_id, sheet, range)'})
+            results[i] = query | {'error': 'Missing required keys (spreadsheet_id, sheet, range)'}
             continue
-
+        
+        # Construct the range
+        full_range = _a1_range(sheet, range_str)
+        groups.setdefault(spreadsheet_id, {}).setdefault(full_range, []).append(i)
+    
+    def fetch_group(group):
+        spreadsheet_id, ranges = group
         try:
-            # Construct the range
-            full_range = f"{sheet}!{range_str}"
-            
-            # Call the Sheets API
-            result = sheets_service.spreadsheets().values().get(
+            # Call the Sheets API for all ranges of this spreadsheet at once
+            result = sheets_service.spreadsheets().values().batchGet(
                 spreadsheetId=spreadsheet_id,
-                range=full_range
+                ranges=list(ranges),
+                valueRenderOption=value_render_option,
+                dateTimeRenderOption=date_time_render_option
             ).execute()
             
-            # Get the values from the response
-            values = result.get('values', [])
-            results.append({**query, 'data': values})
+            # valueRanges come back in the order the ranges were requested
+            for indices, value_range in zip(ranges.values(), result.get('valueRanges', [])):
+                values = value_range.get('values', [])
+                for i in indices:
+                    results[i] = queries[i] | {'data': values}
+        
+        except Exception:
+            # A single bad range fails the whole batch, so fall back to one
+            # request per range to report errors against the right queries
+            for full_range, indices in ranges.items():
+                try:
+                    result = sheets_service.spreadsheets().values().get(
+                        spreadsheetId=spreadsheet_id,
+                        range=full_range,
+                        valueRenderOption=value_render_option,
+                        dateTimeRenderOption=date_time_render_option
+                    ).execute()
+                    outcome = {'data': result.get('values', [])}
+                except Exception as e:
+                    outcome = {'error': str(e)}
+                for i in indices:
+                    results[i] = queries[i] | outcome
+    
+    # Spreadsheets are independent, so their batchGets run concurrently; each
+    # group writes only its own query slots
+    list(_api_executor.map(fetch_group, groups.items()))
+    
+    return results
+
 
-        except Exception as e:
-            results.append({**query, 'error': str(e)})
+def _summarize_spreadsheet(sheets_service, spreadsheet_id: str, rows_to_fetch: int,
+                           value_render_option: str, date_time_render_option: str) -> Dict[str, Any]:
+    """Build the get_multiple_spreadsheet_summary entry for a single spreadsheet"""
+    summary_data = {
+        'spreadsheet_id': spreadsheet_id,
+        'title': None,
+        'sheets': [],
+        'error': None
+    }
+    try:
+        # Get spreadsheet metadata
+        spreadsheet = _get_metadata(sheets_service, spreadsheet_id, 'properties.title,sheets(properties(title,sheetId))')
+        
+        summary_data['title'] = spreadsheet.get('properties', {}).get('title', 'Unknown Title')
+        
+        max_row = max(1, rows_to_fetch) # Ensure at least 1 row is fetched
+        sheet_summaries = []
+        to_fetch = []  # (sheet_summary, range) for every sheet whose rows we need
+        for sheet in spreadsheet.get('sheets') or ():
+            props = sheet.get('properties') or {}
+            sheet_title = props.get('title')
+            sheet_id = props.get('sheetId')
+            sheet_summary = {
+                'title': sheet_title,
+                'sheet_id': sheet_id,
+                'headers': [],
+                'first_rows': [],
+                'error': None
+            }
+            sheet_summaries.append(sheet_summary)
             
-    return results
+            if not sheet_title:
+                sheet_summary['error'] = 'Sheet title not found'
+                continue
+            
+            # Fetch all columns of the first few rows
+            to_fetch.append((sheet_summary, _a1_range(sheet_title, f"A1:{max_row}")))
+        
+        def fill(sheet_summary, values):
+            if values:
+                sheet_summary['headers'] = values[0]
+                if len(values) > 1:
+                    sheet_summary['first_rows'] = values[1:max_row]
+        
+        if to_fetch:
+            try:
+                # One batchGet covers the first rows of every sheet
+                result = sheets_service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=[range_to_get for _, range_to_get in to_fetch],
+                    valueRenderOption=value_render_option,
+                    dateTimeRenderOption=date_time_render_option
+                ).execute()
+                for (sheet_summary, _), value_range in zip(to_fetch, result.get('valueRanges', [])):
+                    fill(sheet_summary, value_range.get('values', []))
+            except Exception:
+                # Fall back to one request per sheet so a single bad sheet only fails itself
+                for sheet_summary, range_to_get in to_fetch:
+                    try:
+                        result = sheets_service.spreadsheets().values().get(
+                            spreadsheetId=spreadsheet_id,
+                            range=range_to_get,
+                            valueRenderOption=value_render_option,
+                            dateTimeRenderOption=date_time_render_option
+                        ).execute()
+                        fill(sheet_summary, result.get('values', []))
+                    except Exception as sheet_e:
+                        sheet_summary['error'] = f"Error fetching data for sheet {sheet_summary['title']}: {sheet_e}"
+        
+        summary_data['sheets'] = sheet_summaries
+        
+    except Exception as e:
+        summary_data['error'] = f'Error fetching spreadsheet {spreadsheet_id}: {e}'
+    
+    return summary_data
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
+@_run_in_thread
 def get_multiple_spreadsheet_summary(spreadsheet_ids: List[str],
-                                   rows_to_fetch: int = 5) -> List[Dict[str, Any]]:
+                                   rows_to_fetch: int = 5,
+                                   value_render_option: str = 'FORMATTED_VALUE',
+                                   date_time_render_option: str = 'SERIAL_NUMBER') -> List[Dict[str, Any]]:
     """
     Get a summary of multiple Google Spreadsheets, including sheet names, 
     headers, and the first few rows of data for each sheet.
@@ -652,85 +1425,29 @@ def get_multiple_spreadsheet_summary(spreadsheet_ids: List[str],
     Args:
         spreadsheet_ids: A list of spreadsheet IDs to summarize.
         rows_to_fetch: The number of rows (including header) to fetch for the summary (default: 5).
+        value_render_option: 'FORMATTED_VALUE' (default), 'UNFORMATTED_VALUE' or 'FORMULA',
+            as in get_sheet_data.
+        date_time_render_option: 'SERIAL_NUMBER' (default) or 'FORMATTED_STRING', as in get_sheet_data.
     
     Returns:
         A list of dictionaries, each representing a spreadsheet summary. 
         Includes spreadsheet title, sheet summaries (title, headers, first rows), or an error.
     """
     sheets_service, _, _ = get_google_services()
-    summaries = []
-    
-    for spreadsheet_id in spreadsheet_ids:
-        summary_data = {
-            'spreadsheet_id': spreadsheet_id,
-            'title': None,
-            'sheets': [],
-            'error': None
-        }
-        try:
-            # Get spreadsheet metadata
-            spreadsheet = sheets_service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id,
-                fields='properties.title,sheets(properties(title,sheetId))'
-            ).execute()
-            
-            summary_data['title'] = spreadsheet.get('properties', {}).get('title', 'Unknown Title')
-            
-            sheet_summaries = []
-            for sheet in spreadsheet.get('sheets', []):
-                sheet_title = sheet.get('properties', {}).get('title')
-                sheet_id = sheet.get('properties', {}).get('sheetId')
-                sheet_summary = {
-                    'title': sheet_title,
-                    'sheet_id': sheet_id,
-                    'headers': [],
-                    'first_rows': [],
-                    'error': None
-                }
-                
-                if not sheet_title:
-                    sheet_summary['error'] = 'Sheet title not found'
-                    sheet_summaries.append(sheet_summary)
-                    continue
-                    
-                try:
-                    # Fetch the first few rows (e.g., A1:Z5)
-                    # Adjust range if fewer rows are requested
-                    max_row = max(1, rows_to_fetch) # Ensure at least 1 row is fetched
-                    range_to_get = f"{sheet_title}!A1:{max_row}" # Fetch all columns up to max_row
-                    
-                    result = sheets_service.spreadsheets().values().get(
-                        spreadsheetId=spreadsheet_id,
-                        range=range_to_get
-                    ).execute()
-                    
-                    values = result.get('values', [])
-                    
-                    if values:
-                        sheet_summary['headers'] = values[0]
-                        if len(values) > 1:
-                            sheet_summary['first_rows'] = values[1:max_row]
-                    else:
-                        # Handle empty sheets or sheets with less data than requested
-                        sheet_summary['headers'] = []
-                        sheet_summary['first_rows'] = []
-
-                except Exception as sheet_e:
-                    sheet_summary['error'] = f'Error fetching data for sheet {sheet_title}: {sheet_e}'
-                
-                sheet_summaries.append(sheet_summary)
-            
-            summary_data['sheets'] = sheet_summaries
-            
-        except Exception as e:
-            summary_data['error'] = f'Error fetching spreadsheet {spreadsheet_id}: {e}'
-            
-        summaries.append(summary_data)
+    
+    # Summarize the spreadsheets concurrently; map() keeps the input order
+    summaries = list(_api_executor.map(
+        lambda spreadsheet_id: _summarize_spreadsheet(sheets_service, spreadsheet_id, rows_to_fetch,
+                                                      value_render_option, date_time_render_option),
+        spreadsheet_ids
+    ))
         
     return summaries
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
+@_run_in_thread
+@_cached_read
 def get_spreadsheet_info(spreadsheet_id: str) -> str:
     """
     Get basic information about a Google Spreadsheet.
@@ -744,25 +1461,26 @@ def get_spreadsheet_info(spreadsheet_id: str) -> str:
     sheets_service, _, _ = get_google_services()
     
     # Get spreadsheet metadata
-    spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+    spreadsheet = _get_metadata(sheets_service, spreadsheet_id, 'properties.title,sheets.properties(title,sheetId,gridProperties)')
     
     # Extract relevant information
     info = {
         "title": spreadsheet.get('properties', {}).get('title', 'Unknown'),
         "sheets": [
             {
-                "title": sheet['properties']['title'],
-                "sheetId": sheet['properties']['sheetId'],
-                "gridProperties": sheet['properties'].get('gridProperties', {})
+                "title": props['title'],
+                "sheetId": props['sheetId'],
+                "gridProperties": props.get('gridProperties', {})
             }
-            for sheet in spreadsheet.get('sheets', [])
+            for props in (sheet['properties'] for sheet in spreadsheet.get('sheets', []))
         ]
     }
     
-    return json.dumps(info, indent=2)
+    return _json_dumps(info)
 
 
 @mcp.tool()
+@_run_in_thread
 def create_spreadsheet(title: str) -> Dict[str, Any]:
     """
     Create a new Google Spreadsheet.
@@ -783,6 +1501,7 @@ def create_spreadsheet(title: str) -> Dict[str, Any]:
     if folder_id:
         file_body['parents'] = [folder_id]
     
+    _drive_limiter(drive_service).acquire()
     spreadsheet = drive_service.files().create(
         supportsAllDrives=True,
         body=file_body,
@@ -792,6 +1511,10 @@ def create_spreadsheet(title: str) -> Dict[str, Any]:
     spreadsheet_id = spreadsheet.get('id')
     parents = spreadsheet.get('parents')
     print(f"Spreadsheet created with ID: {spreadsheet_id}")
+    
+    # The new spreadsheet must show up in the next listing
+    with _list_cache_lock:
+        _list_cache.pop(drive_service, None)
 
     return {
         'spreadsheetId': spreadsheet_id,
@@ -801,6 +1524,8 @@ def create_spreadsheet(title: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet_id')
 def create_sheet(spreadsheet_id: str, 
                 title: str) -> Dict[str, Any]:
     """
@@ -845,14 +1570,29 @@ def create_sheet(spreadsheet_id: str,
     }
 
 
+# Recent list_spreadsheets results, held per Drive client (and so per user) and keyed
+# by query, so agents re-listing the same Drive don't pay for a fresh scan each time
+LIST_CACHE_TTL = float(os.environ.get('MCP_LIST_TTL', '30'))  # seconds
+_list_cache: 'weakref.WeakKeyDictionary[Any, Dict[str, Tuple[float, List[Dict[str, str]]]]]' = weakref.WeakKeyDictionary()
+_list_cache_lock = threading.Lock()
+
+
 @mcp.tool(annotations={"readOnlyHint": True})
-def list_spreadsheets() -> List[Dict[str, str]]:
+@_run_in_thread
+def list_spreadsheets(page_size: Optional[int] = None,
+                      page_token: Optional[str] = None) -> Union[List[Dict[str, str]], Dict[str, Any]]:
     """
     List all spreadsheets in the configured Google Drive folder.
     If no folder is configured, lists spreadsheets from 'My Drive'.
     
+    Args:
+        page_size: Optional - return a single page of at most this many spreadsheets
+                   (up to 1000) instead of the full listing
+        page_token: Optional - the nextPageToken of a previous paged call, to fetch the next page
+    
     Returns:
-        List of spreadsheets with their ID and title
+        List of spreadsheets with their ID and title. When paging, a dictionary with
+        'spreadsheets' and 'nextPageToken' (None on the last page)
     """
     _, drive_service, folder_id = get_google_services()
     
@@ -865,25 +1605,107 @@ def list_spreadsheets() -> List[Dict[str, str]]:
     else:
         print("Searching for spreadsheets in 'My Drive'")
     
-    # List spreadsheets
-    results = drive_service.files().list(
-        q=query,
-        spaces='drive',
-        includeItemsFromAllDrives=True,
-        supportsAllDrives=True,
-        fields='files(id, name)',
-        orderBy='modifiedTime desc'
-    ).execute()
+    paged = page_size is not None or page_token is not None
+    if not paged:
+        with _list_cache_lock:
+            cached = _list_cache.get(drive_service, {}).get(query)
+        if cached is not None and time.monotonic() - cached[0] < LIST_CACHE_TTL:
+            return list(cached[1])
+    
+    list_params = {
+        'q': query,
+        'spaces': 'drive',
+        'includeItemsFromAllDrives': True,
+        'supportsAllDrives': True,
+        'fields': 'nextPageToken,files(id,name)',
+        'orderBy': 'modifiedTime desc',
+        'pageSize': page_size or 1000
+    }
+    if page_token:
+        list_params['pageToken'] = page_token
     
-    spreadsheets = results.get('files', [])
+    # List spreadsheets: one page when paging, otherwise follow nextPageToken through
+    # every page so large Drives aren't silently truncated
+    spreadsheets = []
+    request = drive_service.files().list(**list_params)
+    while request is not None:
+        _drive_limiter(drive_service).acquire()
+        results = request.execute()
+        spreadsheets.extend(results.get('files', []))
+        request = None if paged else drive_service.files().list_next(request, results)
     
-    return [{'id': sheet['id'], 'title': sheet['name']} for sheet in spreadsheets]
+    # Rename Drive's 'name' to 'title' in place; the fields mask already limits each entry to id/name
+    for sheet in spreadsheets:
+        sheet['title'] = sheet.pop('name')
+    
+    if paged:
+        return {'spreadsheets': spreadsheets, 'nextPageToken': results.get('nextPageToken')}
+    
+    with _list_cache_lock:
+        _list_cache.setdefault(drive_service, {})[query] = (time.monotonic(), spreadsheets)
+    
+    return list(spreadsheets)
+
+
+# Drive accepts at most 100 sub-requests per batch
+SHARE_BATCH_SIZE = 100
+# Below this many recipients, concurrent single requests beat a multipart batch
+SHARE_BATCH_THRESHOLD = 5
+
+_VALID_ROLES = frozenset(('reader', 'commenter', 'writer'))
+
+# Deliberately loose: catches obvious typos locally and leaves the rest to Drive
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_valid_email(email_address: str) -> bool:
+    """Whether email_address looks like an email address"""
+    return _EMAIL_RE.fullmatch(email_address.strip()) is not None
+
+
+def _share_result(successes: List[Dict[str, Any]], failures: List[Dict[str, Any]],
+                  deduplicated: int, compact: bool) -> Dict[str, Any]:
+    """Build share_spreadsheet's reply, optionally transposed into columns so keys appear once"""
+    if not compact:
+        return {"successes": successes, "failures": failures, "deduplicated": deduplicated}
+    return {
+        "successes": {key: [s[key] for s in successes] for key in ('email_address', 'role', 'permissionId')},
+        "failures": {key: [f.get(key) for f in failures] for key in ('email_address', 'error', 'status', 'reason')},
+        "deduplicated": deduplicated,
+    }
+
+
+def _api_error_reason(e: Exception) -> Optional[str]:
+    """Google's machine-readable reason code for an API error (e.g. 'rateLimitExceeded'), if any"""
+    if isinstance(e, HttpError):
+        reasons = _api_error_reasons(e)
+        if reasons:
+            return reasons[0]
+    return None
+
+
+def _api_error_message(e: Exception) -> str:
+    """Pull the human-readable message out of a Google API error, falling back to str(e)"""
+    if isinstance(e, HttpError):
+        # HttpError already parsed the response body into .reason when it was raised
+        return e.reason or str(e)
+    error_details = str(e)
+    if hasattr(e, 'content'):
+        try:
+            error_content = _json_loads(e.content)
+            error_details = error_content.get('error', {}).get('message', error_details)
+        except json.JSONDecodeError:
+            pass # Keep the original error string
+    return error_details
 
 
 @mcp.tool()
+@_run_in_thread
 def share_spreadsheet(spreadsheet_id: str, 
                       recipients: List[Dict[str, str]],
-                      send_notification: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+                      send_notification: bool = True,
+                      compact: bool = False) -> Dict[str, Any]:
     """
     Share a Google Spreadsheet with multiple users via email, assigning specific roles.
     
@@ -895,15 +1717,25 @@ def share_spreadsheet(spreadsheet_id: str,
                         {'email_address': 'user1@example.com', 'role': 'writer'},
                         {'email_address': 'user2@example.com', 'role': 'reader'}
                     ]
+                    An email address listed more than once is shared once, with the
+                    last role given for it.
         send_notification: Whether to send a notification email to the users. Defaults to True.
+        compact: Return 'successes' and 'failures' column-wise (a dict of key -> list of
+                 values) instead of one dict per recipient, which is much smaller for
+                 long recipient lists. Defaults to False.
 
     Returns:
         A dictionary containing lists of 'successes' and 'failures'. 
         Each item in the lists includes the email address and the outcome.
+        Failed API calls also carry the HTTP 'status' of the error and Google's
+        'reason' code (e.g. 'rateLimitExceeded') when one was given.
+        'deduplicated' counts the repeated recipient entries that were skipped.
     """
-    _, drive_service, _ = get_google_services()
     successes = []
     failures = []
+    pending = []  # (email_address, role, permission) for each valid recipient
+    seen = {}  # lowercased email -> index into pending
+    deduplicated = 0
     
     for recipient in recipients:
         email_address = recipient.get('email_address')
@@ -915,8 +1747,15 @@ def share_spreadsheet(spreadsheet_id: str,
                 'error': 'Missing email_address in recipient entry.'
             })
             continue
+        
+        if not _is_valid_email(email_address):
+            failures.append({
+                'email_address': email_address,
+                'error': 'Invalid email format.'
+            })
+            continue
             
-        if role not in ['reader', 'commenter', 'writer']:
+        if role not in _VALID_ROLES:
              failures.append({
                 'email_address': email_address,
                 'error': f"Invalid role '{role}'. Must be 'reader', 'commenter', or 'writer'."
@@ -928,37 +1767,104 @@ def share_spreadsheet(spreadsheet_id: str,
             'role': role,
             'emailAddress': email_address
         }
-        
-        try:
-            result = drive_service.permissions().create(
-                fileId=spreadsheet_id,
-                body=permission,
-                sendNotificationEmail=send_notification,
-                fields='id'
-            ).execute()
+        # Drive matches emails case-insensitively, so repeats would only burn quota;
+        # the last role given for an address wins
+        key = email_address.strip().lower()
+        if key in seen:
+            pending[seen[key]] = (email_address, role, permission)
+            deduplicated += 1
+            continue
+        seen[key] = len(pending)
+        pending.append((email_address, role, permission))
+    
+    def record(i, response, exception):
+        email_address, role, _ = pending[i]
+        if exception is None:
             successes.append({
                 'email_address': email_address, 
                 'role': role, 
-                'permissionId': result.get('id')
+                'permissionId': response.get('id')
             })
-        except Exception as e:
-            # Try to provide a more informative error message
-            error_details = str(e)
-            if hasattr(e, 'content'):
-                try:
-                    error_content = json.loads(e.content)
-                    error_details = error_content.get('error', {}).get('message', error_details)
-                except json.JSONDecodeError:
-                    pass # Keep the original error string
+        else:
+            message = _api_error_message(exception)
+            logger.debug("Sharing %s with %s failed: %s", spreadsheet_id, email_address, message)
             failures.append({
                 'email_address': email_address,
-                'error': f"Failed to share: {error_details}"
+                'error': f"Failed to share: {message}",
+                # Lets callers tell e.g. a bad grantee (403) from rate limiting (429)
+                'status': exception.resp.status if isinstance(exception, HttpError) else None,
+                'reason': _api_error_reason(exception)
             })
+    
+    if not pending:
+        # Nothing survived validation, so there is no need to touch Drive
+        return _share_result(successes, failures, deduplicated, compact)
+    
+    _, drive_service, _ = get_google_services()
+    create_permission = drive_service.permissions().create
+    drive_limiter = _drive_limiter(drive_service)
+    
+    def permission_request(i):
+        return create_permission(
+            fileId=spreadsheet_id,
+            body=pending[i][2],
+            sendNotificationEmail=send_notification,
+            fields='id'
+        )
+    
+    if len(pending) < SHARE_BATCH_THRESHOLD:
+        # A handful of recipients is quicker as concurrent plain requests than as a multipart batch
+        def share_one(i):
+            # Built inside the worker, since requests run on the thread that created them
+            drive_limiter.acquire()
+            try:
+                return permission_request(i).execute(), None
+            except Exception as e:
+                return None, e
+        
+        for i, (response, exception) in enumerate(_api_executor.map(share_one, range(len(pending)))):
+            record(i, response, exception)
+        return _share_result(successes, failures, deduplicated, compact)
+    
+    def on_response(request_id, response, exception):
+        i = int(request_id)
+        # A create that 5xx'd may still have gone through, and repeating it would resend the
+        # notification email, so only sub-requests Drive rejected outright are re-queued
+        if exception is not None and _is_retryable(exception, idempotent=False) and attempt < API_MAX_RETRIES:
+            retry.append((i, exception))
+        else:
+            record(i, response, exception)
+    
+    # Send the permission creates as multipart batches instead of one round-trip per recipient,
+    # re-queueing sub-requests that hit transient errors into a follow-up batch after a backoff
+    queue = list(range(len(pending)))
+    for attempt in range(API_MAX_RETRIES + 1):
+        retry = []
+        for start in range(0, len(queue), SHARE_BATCH_SIZE):
+            chunk = queue[start:start + SHARE_BATCH_SIZE]
+            batch = drive_service.new_batch_http_request(callback=on_response)
+            for i in chunk:
+                batch.add(permission_request(i), request_id=str(i))
+            try:
+                drive_limiter.acquire()
+                batch.execute()
+            except Exception as e:
+                if _is_retryable(e, idempotent=False) and attempt < API_MAX_RETRIES:
+                    retry.extend((i, e) for i in chunk)
+                    continue
+                # The batch request itself failed, so none of its recipients were shared
+                for i in chunk:
+                    record(i, None, e)
+        if not retry:
+            break
+        queue = sorted(i for i, _ in retry)
+        time.sleep(max(_retry_delay(e, attempt) for _, e in retry))
             
-    return {"successes": successes, "failures": failures}
+    return _share_result(successes, failures, deduplicated, compact)
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
+@_run_in_thread
 def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
     Search for content across Google Spreadsheets.
@@ -986,6 +1892,7 @@ def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
             search_query += f" and '{folder_id}' in parents"
         
         # Search for spreadsheets
+        _drive_limiter(drive_service).acquire()
         drive_results = drive_service.files().list(
             q=search_query,
             spaces='drive',
@@ -1004,10 +1911,7 @@ def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
             
             try:
                 # Get all sheets in this spreadsheet
-                spreadsheet_info = sheets_service.spreadsheets().get(
-                    spreadsheetId=spreadsheet_id,
-                    fields='sheets(properties(title,sheetId))'
-                ).execute()
+                spreadsheet_info = _get_metadata(sheets_service, spreadsheet_id, 'sheets(properties(title,sheetId))')
                 
                 # Search through each sheet for content matching the query
                 for sheet in spreadsheet_info.get('sheets', []):
@@ -1017,7 +1921,7 @@ def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
                     # Get sheet data to search through
                     try:
                         # Get a reasonable range to search (first 1000 rows, all columns)
-                        range_name = f"{sheet_title}!A1:ZZ1000"
+                        range_name = _a1_range(sheet_title, "A1:ZZ1000")
                         values_result = sheets_service.spreadsheets().values().get(
                             spreadsheetId=spreadsheet_id,
                             range=range_name
@@ -1106,6 +2010,8 @@ def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
 
 
 @mcp.tool()
+@_run_in_thread
+@_invalidates_reads('spreadsheet_id')
 def format_cells(spreadsheet_id: str,
                 sheet: str,
                 range: str,
@@ -1147,42 +2053,25 @@ def format_cells(spreadsheet_id: str,
     sheets_service, _, _ = get_google_services()
     
     # Get sheet ID
-    spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-    sheet_id = None
+    sheet_id = _resolve_sheet_id(sheets_service, spreadsheet_id, sheet)
     
-    for s in spreadsheet['sheets']:
-        if s['properties']['title'] == sheet:
-            sheet_id = s['properties']['sheetId']
-            break
-            
     if sheet_id is None:
         return {"error": f"Sheet '{sheet}' not found"}
     
     # Convert A1 notation to grid coordinates
     def a1_to_grid_coords(a1_range):
-        """Convert A1 notation like 'A1:C10' to grid coordinates"""
-        import re
-        
-        # Parse range like 'A1:C10'
-        match = re.match(r'([A-Z]+)(\d+):([A-Z]+)(\d+)', a1_range)
+        """Convert A1 notation like 'A1:C10' (or a single cell like 'A1') to grid coordinates"""
+        match = _A1_CELL_OR_RANGE_RE.match(a1_range)
         if not match:
-            # Single cell like 'A1'
-            match = re.match(r'([A-Z]+)(\d+)', a1_range)
-            if match:
-                start_col, start_row = match.groups()
-                return {
-                    'startRowIndex': int(start_row) - 1,
-                    'endRowIndex': int(start_row),
-                    'startColumnIndex': sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(start_col))) - 1,
-                    'endColumnIndex': sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(start_col)))
-                }
-            else:
-                raise ValueError(f"Invalid A1 range format: {a1_range}")
+            raise ValueError(f"Invalid A1 range format: {a1_range}")
         
         start_col, start_row, end_col, end_row = match.groups()
+        if end_col is None:
+            # Single cell like 'A1'
+            end_col, end_row = start_col, start_row
         
         def col_to_index(col):
-            return sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(col))) - 1
+            return sum((ord(c) - ord('A') + 1) * (26 ** i) for i, c in enumerate(reversed(col.upper()))) - 1
         
         return {
             'startRowIndex': int(start_row) - 1,
@@ -1313,10 +2202,7 @@ def format_cells(spreadsheet_id: str,
         "requests": requests
     }
     
-    result = sheets_service.spreadsheets().batchUpdate(
-        spreadsheetId=spreadsheet_id,
-        body=request_body
-    ).execute()
+    result = _execute_sheet_update(sheets_service, spreadsheet_id, sheet, sheet_id, request_body)
     
     return result
 
@@ -1429,6 +2315,7 @@ def get_formatting_presets() -> Dict[str, Dict[str, Any]]:
 
 
 @mcp.tool(annotations={"readOnlyHint": True})
+@_run_in_thread
 def fetch(id: str) -> str:
     """
     Fetch content from a specific Google Spreadsheet resource.
@@ -1464,7 +2351,7 @@ def fetch(id: str) -> str:
         
         if resource_type == 'info':
             # Get spreadsheet information
-            spreadsheet = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
+            spreadsheet = _get_metadata(sheets_service, spreadsheet_id, 'properties,sheets.properties(title,sheetId,gridProperties)')
             
             info = {
                 'spreadsheet_id': spreadsheet_id,
@@ -1480,7 +2367,7 @@ def fetch(id: str) -> str:
                 'properties': spreadsheet.get('properties', {})
             }
             
-            return json.dumps(info, indent=2)
+            return _json_dumps(info)
         
         elif len(parts) >= 2:
             # Get sheet data
@@ -1489,10 +2376,10 @@ def fetch(id: str) -> str:
             if len(parts) >= 3:
                 # Specific range requested
                 range_str = '/'.join(parts[2:])
-                full_range = f"{sheet_name}!{range_str}"
+                full_range = _a1_range(sheet_name, range_str)
             else:
                 # Entire sheet
-                full_range = sheet_name
+                full_range = _a1_sheet(sheet_name)
             
             # Get the data
             result = sheets_service.spreadsheets().values().get(
@@ -1511,7 +2398,7 @@ def fetch(id: str) -> str:
                 'column_count': len(values[0]) if values else 0
             }
             
-            return json.dumps(response_data, indent=2)
+            return _json_dumps(response_data)
         
         else:
             return json.dumps({'error': 'Invalid ID format'})
@@ -1539,35 +2426,34 @@ def main():
     Optional configuration:
     - DRIVE_FOLDER_ID: Google Drive folder ID for organizing spreadsheets
     """
-    print(f"Starting Google Spreadsheet FastMCP2 Server...")
-    print(f"Transport: {TRANSPORT}")
-    
-    # Show authentication configuration
-    print("✅ FastMCP Google OAuth authentication enabled")
-    print(f"   Base URL: {GOOGLE_BASE_URL}")
-    print(f"   Scopes: {GOOGLE_SCOPES}")
-    
-    # Get log level from environment
-    log_level = os.environ.get('FASTMCP_LOG_LEVEL', 'INFO')
-    print(f"Log Level: {log_level}")
+    # Build the startup banner up front and write it in one go
+    banner = [
+        "Starting Google Spreadsheet FastMCP2 Server...",
+        f"Transport: {TRANSPORT}",
+        # Show authentication configuration
+        "✅ FastMCP Google OAuth authentication enabled",
+        f"   Base URL: {GOOGLE_BASE_URL}",
+        f"   Scopes: {GOOGLE_SCOPES}",
+        f"Log Level: {LOG_LEVEL}",
+    ]
+    run_kwargs = {'transport': TRANSPORT, 'log_level': LOG_LEVEL}
     
     # Configure network settings for HTTP/SSE transports
     if TRANSPORT in ['http', 'sse']:
-        host = os.environ.get('MCP_HOST', '0.0.0.0')
-        port = int(os.environ.get('MCP_PORT', '8000'))
-        print(f"Host: {host}")
-        print(f"Port: {port}")
-        print(f"Server will be accessible at: http://{host}:{port}")
-        
-        print(f"OAuth callback URL: http://{host}:{port}/auth/callback")
-        print("Make sure this URL is configured in your Google OAuth Client settings")
-        
-        mcp.run(transport=TRANSPORT, host=host, port=port, log_level=log_level)
+        banner += [
+            f"Host: {MCP_HOST}",
+            f"Port: {MCP_PORT}",
+            f"Server will be accessible at: http://{MCP_HOST}:{MCP_PORT}",
+            f"OAuth callback URL: http://{MCP_HOST}:{MCP_PORT}/auth/callback",
+            "Make sure this URL is configured in your Google OAuth Client settings",
+        ]
+        run_kwargs.update(host=MCP_HOST, port=MCP_PORT)
     else:
         # Use stdio transport
-        print("Note: Google OAuth requires HTTP transport. Using stdio transport.")
-        mcp.run(transport=TRANSPORT, log_level=log_level)
-
+        banner.append("Note: Google OAuth requires HTTP transport. Using stdio transport.")
+    
+    print("\n".join(banner))
+    mcp.run(**run_kwargs)
 
 if __name__ == "__main__":
     main()
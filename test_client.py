@@ -3,6 +3,19 @@ import asyncio
 import argparse
 import json
 
+# orjson is an optional, faster drop-in for printing large tool results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj):
+    """Serialize obj to an indented JSON string, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
 async def list_tools(client):
     """List all available tools from the MCP server."""
     try:
@@ -46,7 +59,7 @@ async def call_tool_by_name(client, tool_name, args_dict=None):
         print("=" * 50)
         
         if result.structured_content:
-            print(json.dumps(result.structured_content, indent=2))
+            print(dumps(result.structured_content))
         else:
             print(result.content)
             